@@ -1,6 +1,17 @@
 """Supplemental ISO8601 duration format support for :py:class:`datetime.timedelta`"""
 import datetime
-from typing import Iterator, TypeAlias
+from functools import lru_cache
+from typing import Iterable, Iterator, TypeAlias
+
+# Preformatted measurements for small quantities, used to avoid string formatting
+_WEEKS = tuple(f"P{quantity}W" for quantity in range(100))
+_DAYS = tuple(f"P{quantity}D" for quantity in range(100))
+_HOURS = tuple(f"{quantity}H" for quantity in range(100))
+_MINUTES = tuple(f"{quantity}M" for quantity in range(100))
+_SECONDS = tuple(f"{quantity}S" for quantity in range(100))
+
+# Longest duration string retained by the parse cache; longer inputs are not memoized
+_CACHED_LENGTH_LIMIT = 64
 
 
 class timedelta(datetime.timedelta):
@@ -10,73 +21,73 @@ class timedelta(datetime.timedelta):
     __slots__ = ()
 
     Components: TypeAlias = Iterator[tuple[str, str, int | None, bool]]
-    Measurements: TypeAlias = Iterator[tuple[str, float]]
+    Measurements: TypeAlias = dict[str, float]
 
     def __repr__(self) -> str:
         return f"timedelta_isoformat.{super().__repr__()}"
 
     @staticmethod
     def _parse_date(segment: str) -> Components:
-        match tuple(segment):
+        length, separator = len(segment), segment.find("-")
 
-            # YYYY-DDD
-            case _, _, _, _, "-", _, _, _:
-                yield segment[0:4], "years", None, True
-                yield segment[5:8], "days", 366, True
+        # YYYY-DDD
+        if length == 8 and separator == 4:
+            yield segment[0:4], "years", None, True
+            yield segment[5:8], "days", 366, True
 
-            # YYYY-MM-DD
-            case _, _, _, _, "-", _, _, "-", _, _:
-                yield segment[0:4], "years", None, True
-                yield segment[5:7], "months", 12, True
-                yield segment[8:10], "days", 31, True
+        # YYYY-MM-DD
+        elif length == 10 and separator == 4 and segment[7] == "-":
+            yield segment[0:4], "years", None, True
+            yield segment[5:7], "months", 12, True
+            yield segment[8:10], "days", 31, True
 
-            # YYYYDDD
-            case _, _, _, _, _, _, _:
-                yield segment[0:4], "years", None, True
-                yield segment[4:7], "days", 366, True
+        # YYYYDDD
+        elif length == 7:
+            yield segment[0:4], "years", None, True
+            yield segment[4:7], "days", 366, True
 
-            # YYYYMMDD
-            case _, _, _, _, _, _, _, _:
-                yield segment[0:4], "years", None, True
-                yield segment[4:6], "months", 12, True
-                yield segment[6:8], "days", 31, True
+        # YYYYMMDD
+        elif length == 8:
+            yield segment[0:4], "years", None, True
+            yield segment[4:6], "months", 12, True
+            yield segment[6:8], "days", 31, True
 
-            case _:
-                raise ValueError(f"unable to parse '{segment}' into date components")
+        else:
+            raise ValueError(f"unable to parse '{segment}' into date components")
 
     @staticmethod
     def _parse_time(segment: str) -> Components:
-        match tuple(segment):
-
-            # HH:MM:SS[.ssssss]
-            case _, _, ":", _, _, ":", _, _, ".", *_:
-                yield segment[0:2], "hours", 24, True
-                yield segment[3:5], "minutes", 60, True
-                yield segment[6:15], "seconds", 60, False
-
-            # HH:MM:SS
-            case _, _, ":", _, _, ":", _, _:
-                yield segment[0:2], "hours", 24, True
-                yield segment[3:5], "minutes", 60, True
-                yield segment[6:8], "seconds", 60, True
-
-            # HHMMSS[.ssssss]
-            case _, _, _, _, _, _, ".", *_:
-                yield segment[0:2], "hours", 24, True
-                yield segment[2:4], "minutes", 60, True
-                yield segment[4:13], "seconds", 60, False
-
-            # HHMMSS
-            case _, _, _, _, _, _:
-                yield segment[0:2], "hours", 24, True
-                yield segment[2:4], "minutes", 60, True
-                yield segment[4:6], "seconds", 60, True
-
-            case _:
-                raise ValueError(f"unable to parse '{segment}' into time components")
+        length = len(segment)
+
+        # HH:MM:SS[.ssssss]
+        if length > 8 and segment[2] == ":" and segment[5] == ":" and segment[8] == ".":
+            yield segment[0:2], "hours", 24, True
+            yield segment[3:5], "minutes", 60, True
+            yield segment[6:15], "seconds", 60, False
+
+        # HH:MM:SS
+        elif length == 8 and segment[2] == ":" and segment[5] == ":":
+            yield segment[0:2], "hours", 24, True
+            yield segment[3:5], "minutes", 60, True
+            yield segment[6:8], "seconds", 60, True
+
+        # HHMMSS[.ssssss]
+        elif length > 6 and segment[6] == ".":
+            yield segment[0:2], "hours", 24, True
+            yield segment[2:4], "minutes", 60, True
+            yield segment[4:13], "seconds", 60, False
+
+        # HHMMSS
+        elif length == 6:
+            yield segment[0:2], "hours", 24, True
+            yield segment[2:4], "minutes", 60, True
+            yield segment[4:6], "seconds", 60, True
+
+        else:
+            raise ValueError(f"unable to parse '{segment}' into time components")
 
     @staticmethod
-    def _parse(duration: Iterator[str], context: Iterator[str] | None = None) -> Components:
+    def _parse(duration: str) -> Measurements:
         """Parser for ISO-8601 duration strings
 
         Each string in this format is composed of either one or two segments: date
@@ -88,21 +99,45 @@ class timedelta(datetime.timedelta):
         measurements in order of largest-to-smallest unit from left-to-right. As an
         exception, week measurement units must not be combined with any other date or
         time units. Segments that lack units are parsed as ISO8601 date/time strings.
-        """
-        date_context = iter(("Y", "years", "M", "months", "D", "days"))
-        context = date_context if not context and next(duration, "") == "P" else context
-        assert context, "durations must begin with the character 'P'"
 
+        Durations that contain no unit designators at all are detected up-front using
+        substring operations, and their segments are passed directly to the date/time
+        parsers without a character-by-character sweep.
+
+        Designator-separated values are validated and recorded as they are encountered,
+        so that the common designator-only forms do not pass through any generators.
+        """
+        assert duration[0:1] == "P", "durations must begin with the character 'P'"
+        assert duration not in ("P", "PT"), "no measurements found"
+        measurements: timedelta.Measurements = {}
+        if duration[-1].isdigit():
+            date_segment, _, time_segment = duration[1:].partition("T")
+            if not f"{date_segment}{time_segment}".strip(",-.0123456789:"):
+                if date_segment:
+                    components = timedelta._parse_date(date_segment.replace(",", "."))
+                    timedelta._to_measurements(components, measurements)
+                if time_segment:
+                    components = timedelta._parse_time(time_segment.replace(",", "."))
+                    timedelta._to_measurements(components, measurements)
+                return measurements
+
+        context = date_context = iter(("Y", "years", "M", "months", "D", "days"))
         accumulator, unit = "", ""
-        for char in duration:
+        stream = iter(duration)
+        next(stream)
+        for char in stream:
             if char in ",-.0123456789:":
                 accumulator += "." if char == "," else char
                 continue
 
             elif char == "T" and context is date_context:
-                time_context = iter(("H", "hours", "M", "minutes", "S", "seconds"))
-                yield from timedelta._parse(duration, context=time_context)
-                break
+                if accumulator:
+                    assert not unit, f"missing unit designator after '{accumulator}'"
+                    components = timedelta._parse_date(accumulator)
+                    timedelta._to_measurements(components, measurements)
+                context = iter(("H", "hours", "M", "minutes", "S", "seconds"))
+                accumulator, unit = "", ""
+                continue
 
             elif char == "W" and context is date_context and not unit:
                 context = iter(("W", "weeks"))
@@ -111,29 +146,31 @@ class timedelta(datetime.timedelta):
             if char not in context:
                 raise ValueError(f"unexpected character '{char}'")
 
-            value, unit, accumulator = accumulator, next(context), ""
-            yield value, unit, None, False
+            unit = next(context)
+            assert accumulator[0:1].isdigit(), (
+                f"unable to parse '{accumulator}' as a positive number"
+            )
+            if quantity := float(accumulator):
+                measurements[unit] = quantity
+            accumulator = ""
 
         if accumulator:
             assert not unit, f"missing unit designator after '{accumulator}'"
             parser = timedelta._parse_date if context is date_context else timedelta._parse_time
-            yield from parser(accumulator)
+            timedelta._to_measurements(parser(accumulator), measurements)
+        return measurements
 
     @staticmethod
-    def _to_measurements(components: Components) -> Measurements:
-        unit = None
+    def _to_measurements(components: Components, measurements: Measurements) -> None:
         for value, unit, limit, integer_only in components:
             assert value.isdigit() if integer_only else value[0:1].isdigit(), f"unable to parse '{value}' as a positive number"
-            quantity = float(value)
-            if limit is None:
-                assert 0 <= quantity, f"{unit} value of {value} exceeds range [0..+∞)"
-            elif limit in (24, 60):
-                assert 0 <= quantity < limit, f"{unit} value of {value} exceeds range [0..{limit})"
-            else:
-                assert 0 <= quantity <= limit, f"{unit} value of {value} exceeds range [0..{limit}]"
+            quantity = int(value) if integer_only else float(value)
+            if limit in (24, 60):
+                assert quantity < limit, f"{unit} value of {value} exceeds range [0..{limit})"
+            elif limit:
+                assert quantity <= limit, f"{unit} value of {value} exceeds range [0..{limit}]"
             if quantity:
-                yield unit, quantity
-        assert unit, "no measurements found"
+                measurements[unit] = quantity
 
     @staticmethod
     def fromisoformat(duration: str) -> "timedelta":
@@ -142,25 +179,61 @@ class timedelta(datetime.timedelta):
         :raises: `ValueError` with an explanatory message when parsing fails
         """
         assert isinstance(duration, str), "expected duration to be a str"
+        if len(duration) > _CACHED_LENGTH_LIMIT:
+            return timedelta._fromisoformat(duration)
+        return timedelta._fromisoformat_cached(duration)
+
+    @staticmethod
+    @lru_cache(maxsize=1024)
+    def _fromisoformat_cached(duration: str) -> "timedelta":
+        """Memoized :py:meth:`_fromisoformat`, for inputs short enough to retain
+
+        Results are immutable, so repeated inputs can safely share a single instance;
+        failed parses raise an exception and are not cached.
+        """
+        return timedelta._fromisoformat(duration)
+
+    @staticmethod
+    def _fromisoformat(duration: str) -> "timedelta":
+        """Implementation of :py:meth:`fromisoformat`"""
         try:
-            return timedelta(**dict(timedelta._to_measurements(timedelta._parse(iter(duration)))))
+            return timedelta(**timedelta._parse(duration))
         except (AssertionError, ValueError) as exc:
             raise ValueError(f"could not parse duration '{duration}': {exc}") from exc
 
+    @staticmethod
+    def fromisoformat_many(durations: Iterable[str]) -> list["timedelta"]:
+        """Parses each of the input strings and returns a list of :py:class:`timedelta`
+        results, in the same order
+
+        :raises: `ValueError` with an explanatory message when parsing fails
+        """
+        fromisoformat = timedelta.fromisoformat
+        return [fromisoformat(duration) for duration in durations]
+
     def isoformat(self) -> str:
         """Produce an ISO8601-style representation of this :py:class:`timedelta`"""
-        assert self >= timedelta(0), f"cannot produce ISO format for negative {self!r}"
-        if not self:
+        assert self.days >= 0, f"cannot produce ISO format for negative {self!r}"
+        return timedelta._isoformat(self.days, self.seconds, self.microseconds)
+
+    @staticmethod
+    @lru_cache(maxsize=1024)
+    def _isoformat(days: int, seconds: int, microseconds: int) -> str:
+        """Memoized implementation of :py:meth:`isoformat`
+
+        Formatting depends only on the normalized days, seconds and microseconds of
+        each value, so equal durations can safely share a single result string.
+        """
+        if not days and not seconds and not microseconds:
             return "P0D"
 
-        if self.days % 7 == 0 and not self.seconds and not self.microseconds:
-            return f"P{int(self.days / 7)}W"
+        if not seconds and not microseconds:
+            if days % 7 == 0:
+                weeks = days // 7
+                return _WEEKS[weeks] if weeks < 100 else f"P{weeks}W"
+            return _DAYS[days] if days < 100 else f"P{days}D"
 
-        days = self.days
-        minutes, seconds = divmod(self.seconds, 60)
-        hours, minutes = divmod(minutes, 60)
-        if self.microseconds:
-            seconds += self.microseconds / 1_000_000  # type: ignore
+        hours, minutes, seconds = seconds // 3600, seconds // 60 % 60, seconds % 60
 
         if hours and days:
             hours += days * 24
@@ -168,14 +241,19 @@ class timedelta(datetime.timedelta):
         if minutes and hours:
             minutes += hours * 60
             hours %= 1
-        if seconds and minutes:
+        if (seconds or microseconds) and minutes:
             seconds += minutes * 60
             minutes %= 1
 
-        result = f"P{days}D" if days else "P"
-        if hours or minutes or seconds:
+        result = (_DAYS[days] if days < 100 else f"P{days}D") if days else "P"
+        if hours or minutes or seconds or microseconds:
             result += "T"
-            result += f"{hours}H" if hours else ""
-            result += f"{minutes}M" if minutes else ""
-            result += f"{seconds:.6f}".rstrip("0").rstrip(".") + "S" if seconds else ""
+            if hours:
+                result += _HOURS[hours] if hours < 100 else f"{hours}H"
+            if minutes:
+                result += _MINUTES[minutes] if minutes < 100 else f"{minutes}M"
+            if microseconds:
+                result += f"{seconds}.{microseconds:06d}".rstrip("0") + "S"
+            elif seconds:
+                result += _SECONDS[seconds] if seconds < 100 else f"{seconds}S"
         return result
@@ -39,11 +39,18 @@ class TimedeltaISOFormatBenchmark(unittest.TestCase):
     """Benchmark testing for :class:`timedelta_isoformat.timedelta`"""
 
     def test_fromisoformat_benchmark(self) -> None:
-        """Benchmark the fromisoformat parser method"""
+        """Benchmark the fromisoformat parser method, bypassing the parse cache"""
+        for duration_string, _ in valid_durations * 5000:
+            timedelta._fromisoformat(duration_string)
+
+    def test_fromisoformat_cached_benchmark(self) -> None:
+        """Benchmark the fromisoformat parser method for repeated inputs"""
         for duration_string, _ in valid_durations * 5000:
             timedelta.fromisoformat(duration_string)
 
     def test_isoformat_benchmark(self) -> None:
-        """Benchmark the isoformat formatting method"""
+        """Benchmark the isoformat formatting method, bypassing the format cache"""
+        isoformat = timedelta._isoformat.__wrapped__
         for _, valid_timedelta in valid_durations * 10000:
-            valid_timedelta.isoformat()
+            days, seconds = valid_timedelta.days, valid_timedelta.seconds
+            isoformat(days, seconds, valid_timedelta.microseconds)
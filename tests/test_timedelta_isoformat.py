@@ -37,6 +37,8 @@ valid_durations = [
     ("PT040506", timedelta(hours=4, minutes=5, seconds=6)),
     ("PT04:05:06", timedelta(hours=4, minutes=5, seconds=6)),
     ("PT00:00:00.001", timedelta(microseconds=1000)),
+    ("P0000-00-31", timedelta(days=31)),
+    ("PT12:34:56.5", timedelta(hours=12, minutes=34, seconds=56.5)),
     # calendar edge cases
     ("P0000-366", timedelta(days=366)),
     ("PT23:59:59", timedelta(hours=23, minutes=59, seconds=59)),
@@ -92,6 +94,12 @@ invalid_durations = [
     ("PT01", "unable to parse '01' into time components"),
     ("PT01:02:3.4", "unable to parse '01:02:3.4' into time components"),
     ("P0000y00m00", "unexpected character 'y'"),
+    ("P0000-00-0", "unable to parse '0000-00-0' into date components"),
+    ("P00000-0-00", "unable to parse '00000-0-00' into date components"),
+    ("PT0102030", "unable to parse '0102030' into time components"),
+    # segments are validated left-to-right, so an invalid date segment is reported first
+    ("P6T1", "unable to parse '6' into date components"),
+    ("P5T25DS", "unable to parse '5' into date components"),
     # decimals must have a non-empty integer value before the separator
     ("PT.5S", "unable to parse '.5' as a positive number"),
     ("P1M.1D", "unable to parse '.1' as a positive number"),
@@ -159,6 +167,17 @@ format_expectations = [
     (timedelta(seconds=86400), "P1D"),
     (timedelta(days=-1, hours=25), "PT1H"),
     (timedelta(seconds=-1, microseconds=1000000), "P0D"),
+    # quantities either side of the preformatted measurement range
+    (timedelta(days=99), "P99D"),
+    (timedelta(days=100), "P100D"),
+    (timedelta(weeks=100), "P100W"),
+    (timedelta(seconds=99), "PT99S"),
+    (timedelta(seconds=100), "PT100S"),
+    # microseconds are preserved when large quantities are carried into seconds
+    (
+        timedelta(days=999999, hours=1, minutes=1, microseconds=1),
+        "PT86399917260.000001S",
+    ),
 ]
 
 formatting_unavailable = [
@@ -187,6 +206,36 @@ class TimedeltaISOFormat(unittest.TestCase):
                     timedelta.fromisoformat(duration_string)
                 self.assertIn(expected_reason, str(context.exception))
 
+    def test_fromisoformat_many(self) -> None:
+        """Batch parsing returns results in input order"""
+        duration_strings = [duration_string for duration_string, _ in valid_durations]
+        expected = [expected_timedelta for _, expected_timedelta in valid_durations]
+        self.assertEqual(expected, timedelta.fromisoformat_many(duration_strings))
+        self.assertEqual([], timedelta.fromisoformat_many(iter([])))
+
+    @unittest.skipIf(sys.flags.optimize, "Some optimizations assume valid input")
+    def test_fromisoformat_many_invalid(self) -> None:
+        """Batch parsing fails when any of the inputs is invalid"""
+        with self.assertRaises(ValueError) as context:
+            timedelta.fromisoformat_many(["PT1H", "PT5S1M", "P1D"])
+        self.assertIn("unexpected character 'M'", str(context.exception))
+
+    def test_fromisoformat_cache_invalid(self) -> None:
+        """Failed parses are not retained by the parse cache"""
+        cache_info = timedelta._fromisoformat_cached.cache_info
+        cache_size = cache_info().currsize
+        with self.assertRaises(ValueError):
+            timedelta.fromisoformat("PT1X")
+        self.assertEqual(cache_size, cache_info().currsize)
+
+    def test_fromisoformat_cache_long_input(self) -> None:
+        """Long inputs are parsed without being retained by the parse cache"""
+        cache_info = timedelta._fromisoformat_cached.cache_info
+        cache_size = cache_info().currsize
+        duration_string = "P" + "0" * 100 + "5D"
+        self.assertEqual(timedelta(days=5), timedelta.fromisoformat(duration_string))
+        self.assertEqual(cache_size, cache_info().currsize)
+
     @unittest.skipIf(sys.flags.optimize, "Some optimizations assume valid input")
     def test_fromisoformat_invalid_type(self) -> None:
         """Parsing cases that should all fail"""